@@ -286,6 +286,30 @@ iso = vol.isosurface(threshold=1.0)
 print('area', iso.area())
 assert 2540 < iso.area() <  3000
 
+# integer data with the threshold equal to voxel values
+ivol = Volume(((X-15)**2 + (Y-15)**2 + (Z-15)**2).astype(np.uint16))
+cf = vtk.vtkContourFilter()
+cf.SetInputData(ivol.imagedata())
+cf.SetValue(0, 225)
+cf.Update()
+iiso = ivol.isosurface(threshold=225)
+print('isosurface N, NCells', iiso.N(), iiso.NCells())
+assert iiso.N() == cf.GetOutput().GetNumberOfPoints()
+assert iiso.NCells() == cf.GetOutput().GetNumberOfCells()
+
+# clean argument
+iiso_raw = ivol.isosurface(threshold=225, clean=False)
+iiso_cln = ivol.isosurface(threshold=225, clean=True)
+assert iiso_raw.N() >= iiso_cln.N() == iiso.N()
+assert np.isclose(iiso_raw.area(), iiso_cln.area())
+
+# flat image, contour lines are cleaned by default
+np.random.seed(0)
+fvol = Volume((np.random.rand(30,30,1)*10).astype(np.uint8))
+fiso = fvol.isosurface(threshold=5)
+assert fiso.N() == fvol.isosurface(threshold=5, clean=True).N()
+assert fiso.N() < fvol.isosurface(threshold=5, clean=False).N()
+
 #lego = vol.legosurface(vmin=0.3, vmax=0.5)
 #show(lego)
 #print('lego.N()', lego.N())
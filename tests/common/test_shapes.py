@@ -1,5 +1,5 @@
 
-from vtkplotter import Arc
+from vtkplotter import Arc, Lines, DashedLine
 import numpy as np
 import vtk
 
@@ -10,3 +10,34 @@ print('---------------------------------')
 #####################################
 arc = Arc(center=None, point1=(1, 1, 1), point2=None, normal=(0, 0, 1), angle=np.pi)
 assert isinstance(arc, Arc)
+
+#####################################
+ln = Lines([(0,0,0), (1,0,0)], [(0,1,0), (1,1,1)])
+assert isinstance(ln, Lines)
+assert ln.N() == 4
+assert ln.NCells() == 2
+assert np.allclose(ln.GetBounds(), [0,1, 0,1, 0,1])
+
+ln = Lines([[(0,0,0), (1,0,0)], [(0,1,0), (1,1,1)]])
+assert ln.N() == 4
+assert ln.NCells() == 2
+
+ln = Lines([(0,0), (1,0), (2,0)], [(0,1), (1,1), (2,1)]) # 2d points
+assert ln.N() == 6
+assert ln.NCells() == 3
+assert np.allclose(ln.points()[:, 2], 0)
+
+ln = Lines([])
+assert ln.N() == 0
+assert ln.NCells() == 0
+
+#####################################
+dl = DashedLine((0,0,0), (2,0,0), spacing=0.2)
+assert isinstance(dl, DashedLine)
+assert dl.N() == 52
+assert dl.NCells() == 26
+assert np.allclose(dl.GetBounds(), [0,2, 0,0, 0,0])
+
+dl = DashedLine([(0,0,0), (1,0,0), (1,1,0)])
+assert dl.N() == 144
+assert dl.NCells() == 72
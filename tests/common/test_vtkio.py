@@ -0,0 +1,90 @@
+from vtkplotter import Sphere, load, settings
+import numpy as np
+import vtk
+import os, shutil, tempfile
+
+print('---------------------------------')
+print('vtkVersion', vtk.vtkVersion().GetVTKVersion())
+print('---------------------------------')
+
+tmpdir = tempfile.mkdtemp()
+
+###################################### load pieces
+sphere = Sphere(res=24)
+fname = os.path.join(tmpdir, 'sphere.vtp')
+writer = vtk.vtkXMLPolyDataWriter()
+writer.SetInputData(sphere.polydata())
+writer.SetNumberOfPieces(2)
+writer.SetFileName(fname)
+writer.Write()
+
+full = load(fname)
+piece0 = load(fname, piece=(0, 2))
+piece1 = load(fname, piece=(1, 2))
+print('Test load pieces', full.N(), piece0.N(), piece1.N())
+assert 0 < piece0.N() < full.N()
+assert piece0.N() + piece1.N() == full.N()
+assert piece0.NCells() + piece1.NCells() == full.NCells()
+assert np.allclose(np.r_[piece0.points(), piece1.points()], full.points())
+
+###################################### load directory with threads
+ddir = os.path.join(tmpdir, 'spheres')
+os.mkdir(ddir)
+for r in [5, 8, 10, 12, 20]: # check the natural sort order s5, s8, s10..
+    Sphere(res=r).write(os.path.join(ddir, 's%d.vtk' % r))
+
+nthreads = settings.loadThreads
+settings.loadThreads = 1
+serial = load(ddir)
+settings.loadThreads = 8
+threaded = load(ddir)
+settings.loadThreads = nthreads
+print('Test load directory', [m.N() for m in threaded])
+assert len(serial) == len(threaded) == 5
+assert [m.N() for m in serial] == [m.N() for m in threaded]
+assert [m.N() for m in serial] == sorted(m.N() for m in serial)
+for ms, mt in zip(serial, threaded):
+    assert np.allclose(ms.points(), mt.points())
+
+###################################### load neutral
+fname = os.path.join(tmpdir, 'tets.neu')
+with open(fname, 'w') as f:
+    f.write('5\n0 0 0\n1 0 0\n0 1 0\n0 0 1\n1 1 1\n'
+            '2\n1 1 2 3 4\n1 2 3 4 5\n') # subdomain + 1-based ids
+neu = load(fname)
+print('Test load neutral', neu.N(), neu.NCells())
+assert neu.N() == 5
+assert neu.NCells() == 2
+assert np.array_equal(neu.faces(), [[0,1,2,3], [1,2,3,4]])
+assert np.allclose(neu.points()[4], [1,1,1])
+
+###################################### load gmesh
+fname = os.path.join(tmpdir, 'quad.gmsh')
+with open(fname, 'w') as f:
+    f.write('$MeshFormat\n2.2 0 8\n$EndMeshFormat\n'
+            '$Nodes\n4\n1 0 0 0\n2 1 0 0\n3 0 1 0\n4 1 1 0.5\n$EndNodes\n'
+            '$Elements\n2\n1 2 2 0 1 1 2 3\n2 2 3 0 1 7 2 4 3\n$EndElements\n') # 2 and 3 tags
+gm = load(fname)
+print('Test load gmesh', gm.N(), gm.NCells())
+assert gm.N() == 4
+assert gm.NCells() == 2
+assert np.array_equal(gm.faces(), [[0,1,2], [1,3,2]])
+assert np.allclose(gm.points()[3], [1,1,0.5])
+
+fname = os.path.join(tmpdir, 'empty.gmsh')
+open(fname, 'w').close()
+assert load(fname) is None
+
+###################################### load pcd
+fname = os.path.join(tmpdir, 'cloud.pcd')
+with open(fname, 'w') as f:
+    f.write('# .PCD v.7\nVERSION .7\nFIELDS x y z rgb\nSIZE 4 4 4 4\nTYPE F F F F\n'
+            'COUNT 1 1 1 1\nWIDTH 3\nHEIGHT 1\nVIEWPOINT 0 0 0 1 0 0 0\nPOINTS 3\nDATA ascii\n'
+            '0 0 0 1\n1 2 3 1\n4 5 6 1\n7 8 9 1\n') # one row more than declared
+pcd = load(fname)
+print('Test load pcd', pcd.N(), pcd.NCells())
+assert pcd.N() == 3
+assert pcd.NCells() == 3
+assert np.allclose(pcd.points(), [[0,0,0], [1,2,3], [4,5,6]])
+
+shutil.rmtree(tmpdir)
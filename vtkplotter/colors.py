@@ -3,6 +3,11 @@ import vtk
 import numpy as np
 import sys
 import vtkplotter.docs as docs
+try:
+    from functools import lru_cache
+except ImportError: # python 2, no caching
+    def lru_cache(maxsize=None):
+        return lambda f: f
 import vtkplotter.settings as settings
 
 __doc__ = (
@@ -298,6 +303,20 @@ def getColor(rgb=None, hsv=None):
             seqcol.append(getColor(sc))
         return seqcol
 
+    if hsv is None and isinstance(rgb, (str, int)): # names and numbers are cached
+        c = _getColorCached(rgb)
+        if isinstance(c, list):
+            return list(c) # do not let the caller modify the cached value
+        return c
+    return _getColor(rgb, hsv)
+
+
+@lru_cache(maxsize=256)
+def _getColorCached(rgb):
+    return _getColor(rgb)
+
+
+def _getColor(rgb=None, hsv=None):
     if str(rgb).isdigit():
         rgb = int(rgb)
 
@@ -685,6 +704,10 @@ _terminal_cols = {
     "w": 7,
 }
 
+# precomputed ANSI sequences for foreground and background colors
+_terminal_fgseq = ["\x1b[%dm" % (30 + i) for i in range(8)]
+_terminal_bgseq = ["\x1b[%dm" % (40 + i) for i in range(8)]
+
 emoji = {
     "~bomb": u"\U0001F4A5",
     "~sparks": u"\U00002728",
@@ -797,13 +820,15 @@ def printc(*strings, **keys):
 
     if not settings.notebookBackend:
         if not _terminal_has_colors or sys.version_info[0] < 3:
+            txts = []
             for s in strings:
-                if "~" in str(s):
+                s = str(s)
+                if "~" in s:
                     for k in emoji.keys():
                         if k in s:
                             s = s.replace(k, "")
-                print(s, end=' ')
-            print(end=end)
+                txts.append(s)
+            sys.stdout.write(" ".join(txts) + end)
             if flush:
                 sys.stdout.flush()
             return
@@ -826,21 +851,17 @@ def printc(*strings, **keys):
         c = "red"
 
     try:
-        txt = str()
-        ns = len(strings) - 1
-        separator = " "
+        txts = []
         offset = 0
-        for i, s in enumerate(strings):
-            if i == ns:
-                separator = ""
-
-            # txt += str(s) + separator
-            if "~" in str(s):  # "in" for some reasons changes s
+        for s in strings:
+            s = str(s)
+            if "~" in s:
                 for k in emoji.keys():
-                    if k in str(s):
+                    if k in s:
                         s = s.replace(k, emoji[k])
                         offset += 1
-            txt += str(s) + separator
+            txts.append(s)
+        txt = " ".join(txts)
 
         if c:
             if isinstance(c, int):
@@ -865,9 +886,9 @@ def printc(*strings, **keys):
             box = ""
         else:
             if c:
-                cseq += "\x1b[" + str(30 + cf) + "m"
+                cseq += _terminal_fgseq[cf]
             if bc:
-                cseq += "\x1b[" + str(40 + cb) + "m"
+                cseq += _terminal_bgseq[cb]
             if underline and not box:
                 special += "\x1b[4m"
             if strike and not box:
@@ -911,5 +932,5 @@ def printc(*strings, **keys):
     except:
         print(*strings, end=end)
 
-    if flush:
+    if flush and not (_terminal_has_colors and end.endswith("\n")): # a tty is line buffered
         sys.stdout.flush()
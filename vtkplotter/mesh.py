@@ -117,11 +117,7 @@ class Mesh(vtk.vtkFollower, ActorBase):
             self.SetProperty(pr)
         elif "PolyData" in inputtype:
             if inputobj.GetNumberOfCells() == 0:
-                carr = vtk.vtkCellArray()
-                for i in range(inputobj.GetNumberOfPoints()):
-                    carr.InsertNextCell(1)
-                    carr.InsertCellPoint(i)
-                inputobj.SetVerts(carr)
+                inputobj.SetVerts(utils._cellArray(n=inputobj.GetNumberOfPoints()))
             self._polydata = inputobj  # cache vtkPolyData and mapper for speed
         elif "structured" in inputtype.lower() or "RectilinearGrid" in inputtype:
             if settings.visibleGridEdges:
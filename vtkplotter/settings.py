@@ -113,6 +113,9 @@ General settings.
     # Path to Voro++ library, http://math.lbl.gov/voro++
     voro_path = '/usr/local/bin'
 
+    # Max number of threads used by load() to read the files of a directory (1 = no threads)
+    loadThreads = 8
+
 
 Usage example:
 
@@ -227,6 +230,9 @@ windowSplittingPosition = None
 # Path to Voro++ library, http://math.lbl.gov/voro++
 voro_path = '/usr/local/bin'
 
+# Max number of threads used by load() to read the files of a directory (1 = no threads)
+loadThreads = 8
+
 
 ####################################################################################
 # notebook support with K3D
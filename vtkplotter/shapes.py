@@ -509,6 +509,19 @@ class Line(Mesh):
         self.name = "Line"
 
 
+def _segmentsPolyData(pts0, pts1):
+    # Build a vtkPolyData made of the line segments going from pts0[i] to pts1[i].
+    # All segments are created at once, instead of appending one vtkLineSource each.
+    n = len(pts0)
+    vpts = vtk.vtkPoints()
+    vpts.SetData(numpy_to_vtk(np.ascontiguousarray(np.c_[pts0, pts1].reshape(-1, 3)),
+                              deep=True))
+    poly = vtk.vtkPolyData()
+    poly.SetPoints(vpts)
+    poly.SetLines(utils._cellArray(np.arange(2 * n).reshape(-1, 2)))
+    return poly
+
+
 class DashedLine(Mesh):
     """
     Build a dashed line segment between points `p0` and `p1`.
@@ -578,17 +591,9 @@ class DashedLine(Mesh):
                     break
                 qs.append(qi)
 
-        polylns = vtk.vtkAppendPolyData()
-        for i,q1 in enumerate(qs):
-            if not i%2: continue
-            q0 = qs[i-1]
-            lineSource = vtk.vtkLineSource()
-            lineSource.SetPoint1(q0)
-            lineSource.SetPoint2(q1)
-            lineSource.Update()
-            polylns.AddInputData(lineSource.GetOutput())
-        polylns.Update()
-        poly = polylns.GetOutput()
+        npairs = len(qs)//2
+        qs = np.array(qs[:2*npairs]).reshape(npairs, 2, 3)
+        poly = _segmentsPolyData(qs[:, 0], qs[:, 1])
 
         Mesh.__init__(self, poly, c, alpha)
         self.lw(lw)
@@ -615,22 +620,24 @@ class Lines(Mesh):
         if endPoints is not None:
             startPoints = np.stack((startPoints, endPoints), axis=1)
 
-        polylns = vtk.vtkAppendPolyData()
-        for twopts in startPoints:
-            lineSource = vtk.vtkLineSource()
-            lineSource.SetPoint1(twopts[0])
-
+        startPoints = np.asarray(startPoints, dtype=float)
+        if startPoints.size == 0:
+            poly = vtk.vtkPolyData()
+        else:
+            if startPoints.ndim == 3 and startPoints.shape[2] == 2: # make sure it is 3d
+                startPoints = np.concatenate((startPoints,
+                                              np.zeros(startPoints.shape[:2] + (1,))), axis=2)
+            if startPoints.ndim != 3 or startPoints.shape[1:] != (2, 3):
+                printc("~times Error in Lines(): cannot build segments from points of shape",
+                       startPoints.shape, c=1)
+                raise RuntimeError()
+            pts0 = startPoints[:, 0]
+            pts1 = startPoints[:, 1]
             if scale != 1:
-                vers = (np.array(twopts[1]) - twopts[0]) * scale
-                pt2 = np.array(twopts[0]) + vers
-            else:
-                pt2 = twopts[1]
-
-            lineSource.SetPoint2(pt2)
-            polylns.AddInputConnection(lineSource.GetOutputPort())
-        polylns.Update()
+                pts1 = pts0 + (pts1 - pts0) * scale
+            poly = _segmentsPolyData(pts0, pts1)
 
-        Mesh.__init__(self, polylns.GetOutput(), c, alpha)
+        Mesh.__init__(self, poly, c, alpha)
         self.lw(lw)
         if dotted:
             self.GetProperty().SetLineStipplePattern(0xF0F0)
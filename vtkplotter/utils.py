@@ -6,6 +6,14 @@ import vtkplotter.colors as colors
 import vtkplotter.docs as docs
 import time
 
+try:
+    _range = xrange # python 2
+except NameError:
+    _range = range
+
+# numpy type matching vtkIdType, 32 or 64 bit depending on how vtk was built
+_idtype = np.int32 if vtk.vtkIdTypeArray().GetDataTypeSize() == 4 else np.int64
+
 __doc__ = (
     """
 Utilities submodule.
@@ -81,11 +89,18 @@ class ProgressBar:
         self.ETA = ETA
         self.clock0 = time.time()
         self._remt = 1e10
+        # precomputed strings, sliced at each update
+        self._fill = char * (width - 2)
+        self._empty = " " * (width - 2)
+        self._erasers = {}
         self._update(0)
         self._counts = 0
         self._oldbar = ""
         self._lentxt = 0
-        self._range = np.arange(start, stop, step)
+        try: # lazy, no array is allocated for the indices
+            self._range = _range(start, stop, step)
+        except TypeError: # non integer bounds
+            self._range = np.arange(start, stop, step)
         self._len = len(self._range)
 
     def print(self, txt="", counts=None):
@@ -96,8 +111,10 @@ class ProgressBar:
             self._update(self._counts + self.step)
         if self.bar != self._oldbar:
             self._oldbar = self.bar
-            eraser = [" "] * self._lentxt + ["\b"] * self._lentxt
-            eraser = "".join(eraser)
+            eraser = self._erasers.get(self._lentxt)
+            if eraser is None:
+                eraser = " " * self._lentxt + "\b" * self._lentxt
+                self._erasers[self._lentxt] = eraser
             if self.ETA:
                 tdenom = (time.time() - self.clock0)
                 if tdenom:
@@ -106,28 +123,21 @@ class ProgressBar:
                 else:
                     vel = 1
                     self._remt = 0.
-                if self._remt > 60:
-                    mins = int(self._remt / 60)
-                    secs = self._remt - 60 * mins
-                    mins = str(mins) + "m"
-                    secs = str(int(secs + 0.5)) + "s "
-                else:
-                    mins = ""
-                    secs = str(int(self._remt + 0.5)) + "s "
-                vel = str(round(vel, 1))
-                eta = "ETA: " + mins + secs + "(" + vel + " it/s) "
                 if self._remt < 1:
                     dt = time.time() - self.clock0
                     if dt > 60:
                         mins = int(dt / 60)
-                        secs = dt - 60 * mins
-                        mins = str(mins) + "m"
-                        secs = str(int(secs + 0.5)) + "s "
+                        eta = "Elapsed time: %dm%ds (%.1f it/s)        " % (
+                               mins, int(dt - 60 * mins + 0.5), vel)
                     else:
-                        mins = ""
-                        secs = str(int(dt + 0.5)) + "s "
-                    eta = "Elapsed time: " + mins + secs + "(" + vel + " it/s)        "
+                        eta = "Elapsed time: %ds (%.1f it/s)        " % (int(dt + 0.5), vel)
                     txt = ""
+                elif self._remt > 60:
+                    mins = int(self._remt / 60)
+                    eta = "ETA: %dm%ds (%.1f it/s) " % (
+                           mins, int(self._remt - 60 * mins + 0.5), vel)
+                else:
+                    eta = "ETA: %ds (%.1f it/s) " % (int(self._remt + 0.5), vel)
             else:
                 eta = ""
             txt = eta + str(txt)
@@ -165,16 +175,36 @@ class ProgressBar:
         af = self.width - 2
         nh = int(round(self.percent / 100 * af))
         if nh == 0:
-            self.bar = "["+self.char_arrow+"%s]" % (" " * (af - 1))
+            self.bar = "[" + self.char_arrow + self._empty[1:] + "]"
         elif nh == af:
-            self.bar = "[%s]" % (self.char * af)
+            self.bar = "[" + self._fill + "]"
         else:
-            self.bar = "[%s%s%s]" % (self.char *(nh-1), self.char_arrow, " " *(af-nh))
+            self.bar = "[" + self._fill[:(nh-1)*len(self.char)] + self.char_arrow + self._empty[nh:] + "]"
         if self.percent < 100:  # and self._remt > 1:
-            ps = " " + str(self.percent) + "%"
-        else:
-            ps = ""
-        self.bar += ps
+            self.bar += " %d%%" % self.percent
+
+
+###########################################################
+def _cellArray(cells=None, n=0):
+    """
+    Return a ``vtkCellArray`` from an array of point ids of shape `(ncells, npts)`,
+    all cells having the same number of points.
+    If `cells` is None build `n` vertex cells, one for each of the first `n` points.
+    """
+    if cells is None:
+        ncells, npts = n, 1
+    else:
+        ncells, npts = np.shape(cells)
+    # packed as [npts, id0, id1.., npts, id0, id1.., ...]
+    ids = np.empty((ncells, npts + 1), dtype=_idtype)
+    ids[:, 0] = npts
+    if cells is None:
+        ids[:, 1] = np.arange(ncells, dtype=_idtype)
+    else:
+        ids[:, 1:] = cells
+    carr = vtk.vtkCellArray()
+    carr.SetCells(ncells, numpy_to_vtkIdTypeArray(ids.ravel(), deep=True))
+    return carr
 
 
 ###########################################################
@@ -239,31 +269,19 @@ def buildPolyData(vertices, faces=None, lines=None, indexOffset=0, fast=True):
         poly.SetLines(linesarr)
 
 
-    if faces is None:
-        sourceVertices = vtk.vtkCellArray()
-        for i in range(len(vertices)):
-            sourceVertices.InsertNextCell(1)
-            sourceVertices.InsertCellPoint(i)
-        poly.SetVerts(sourceVertices)
+    if faces is None: # one vertex cell per point
+        poly.SetVerts(_cellArray(n=len(vertices)))
 
         return poly ###################
 
     # faces exist
-    sourcePolygons = vtk.vtkCellArray()
     faces = np.array(faces)
     if len(faces.shape) == 2 and indexOffset==0 and fast:
         #################### all faces are composed of equal nr of vtxs, FAST
-
-        ast = np.int32
-        if vtk.vtkIdTypeArray().GetDataTypeSize() != 4:
-            ast = np.int64
-
-        nf, nc = faces.shape
-        hs = np.hstack((np.zeros(nf)[:,None] + nc, faces)).astype(ast).ravel()
-        arr = numpy_to_vtkIdTypeArray(hs, deep=True)
-        sourcePolygons.SetCells(nf, arr)
+        sourcePolygons = _cellArray(faces)
 
     else: ########################################## manually add faces, SLOW
+        sourcePolygons = vtk.vtkCellArray()
 
         showbar = False
         if len(faces) > 25000:
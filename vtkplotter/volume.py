@@ -624,19 +624,30 @@ class Volume(vtk.vtkVolume, ActorBase):
         return Mesh(vslice.GetOutput())
 
 
-    def isosurface(self, threshold=True, connectivity=False):
+    def isosurface(self, threshold=True, connectivity=False, clean=None):
         """Return an ``Mesh`` isosurface extracted from the ``Volume`` object.
 
         :param threshold: value or list of values to draw the isosurface(s)
         :type threshold: float, list
         :param bool connectivity: if True only keeps the largest portion of the polydata
+        :param bool clean: run ``vtkCleanPolyData`` on the output.
+            By default this is skipped only for 3D images contoured by ``vtkContourFilter``,
+            which already merges coincident points. ``vtkFlyingEdges3D`` and the contouring
+            of flat images can produce duplicated points and degenerate cells.
 
         |isosurfaces| |isosurfaces.py|_
         """
         scrange = self._imagedata.GetScalarRange()
-        cf = vtk.vtkContourFilter()
+        is3d = min(self._imagedata.GetDimensions()) > 1
+        if hasattr(vtk, 'vtkFlyingEdges3D') and is3d:
+            cf = vtk.vtkFlyingEdges3D() # multi-threaded, much faster than contouring
+        else:
+            cf = vtk.vtkContourFilter()
+            cf.UseScalarTreeOn()
+        if clean is None:
+            # only vtkContourFilter on a 3d image already merges coincident points
+            clean = not is3d or isinstance(cf, vtk.vtkFlyingEdges3D)
         cf.SetInputData(self._imagedata)
-        cf.UseScalarTreeOn()
         cf.ComputeScalarsOn()
         cf.ComputeNormalsOn()
 
@@ -653,10 +664,14 @@ class Volume(vtk.vtkVolume, ActorBase):
             cf.SetValue(0, threshold)
             cf.Update()
 
-        clp = vtk.vtkCleanPolyData()
-        clp.SetInputConnection(cf.GetOutputPort())
-        clp.Update()
-        poly = clp.GetOutput()
+        poly = cf.GetOutput()
+        if clean:
+            clp = vtk.vtkCleanPolyData()
+            clp.SetInputData(poly)
+            clp.ConvertPolysToLinesOff() # drop the degenerate triangles
+            clp.ConvertLinesToPointsOff()
+            clp.Update()
+            poly = clp.GetOutput()
 
         if connectivity:
             conn = vtk.vtkPolyDataConnectivityFilter()
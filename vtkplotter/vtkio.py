@@ -2,7 +2,25 @@ from __future__ import division, print_function
 import vtk
 from vtk.util.numpy_support import vtk_to_numpy
 import os
+import sys
+import glob
+import gzip
+import mmap
+import shutil
+import subprocess
+import tempfile
+import xml.etree.ElementTree as et
 import numpy as np
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError: # python 2
+    ThreadPoolExecutor = None
+try:
+    from urllib.request import urlopen
+except ImportError: # python 2
+    import urllib2
+    import contextlib
+    urlopen = lambda url_: contextlib.closing(urllib2.urlopen(url_))
 
 import vtkplotter.utils as utils
 import vtkplotter.colors as colors
@@ -38,8 +56,63 @@ __all__ = [
     "Video",
 ]
 
-
-def load(inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True):
+# file extension -> name of the vtk class that reads/writes it
+_mesh_readers = {
+    ".vtk": "vtkDataSetReader", # all legacy vtk types
+    ".ply": "vtkPLYReader",
+    ".obj": "vtkOBJReader",
+    ".stl": "vtkSTLReader",
+    ".byu": "vtkBYUReader",
+    ".g": "vtkBYUReader",
+    ".foam": "vtkOpenFOAMReader", # OpenFoam
+    ".vtp": "vtkXMLPolyDataReader",
+    ".vts": "vtkXMLStructuredGridReader",
+    ".vtu": "vtkXMLUnstructuredGridReader",
+    ".vtr": "vtkXMLRectilinearGridReader",
+    ".pvtk": "vtkPDataSetReader",
+    ".pvtr": "vtkXMLPRectilinearGridReader",
+    ".pvtu": "vtkXMLPUnstructuredGridReader",
+    ".txt": "vtkParticleReader", # (format is x, y, z, scalar)
+    ".xyz": "vtkParticleReader",
+    ".facet": "vtkFacetReader",
+}
+
+_image_readers = {
+    ".tif": "vtkTIFFReader",
+    ".tiff": "vtkTIFFReader",
+    ".slc": "vtkSLCReader",
+    ".vti": "vtkXMLImageDataReader",
+    ".mhd": "vtkMetaImageReader",
+    ".dem": "vtkDEMReader",
+    ".nii": "vtkNIFTIImageReader",
+    ".nrrd": "vtkNrrdReader",
+}
+
+_picture_readers = {
+    ".png": "vtkPNGReader",
+    ".jpg": "vtkJPEGReader",
+    ".jpeg": "vtkJPEGReader",
+    ".bmp": "vtkBMPReader",
+}
+
+_writers = {
+    ".vtk": "vtkPolyDataWriter",
+    ".ply": "vtkPLYWriter",
+    ".stl": "vtkSTLWriter",
+    ".vtp": "vtkXMLPolyDataWriter",
+    ".xyz": "vtkSimplePointsWriter",
+    ".facet": "vtkFacetWriter",
+    ".tif": "vtkTIFFWriter",
+    ".vti": "vtkXMLImageDataWriter",
+    ".mhd": "vtkMetaImageWriter",
+    ".nii": "vtkNIFTIImageWriter",
+    ".png": "vtkPNGWriter",
+    ".jpg": "vtkJPEGWriter",
+    ".bmp": "vtkBMPWriter",
+}
+
+
+def load(inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True, piece=()):
     """
     Load ``Mesh``, ``Volume`` and ``Picture`` objects from file.
 
@@ -59,6 +132,8 @@ def load(inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True):
         If set to True will return an ``Mesh`` with automatic choice of the isosurfacing threshold.
     :param list spacing: specify the voxel spacing in the three dimensions
     :param bool unpack: only for multiblock data, if True returns a flat list of objects.
+    :param list piece: only for XML formats `(vtp, vtu, vts, vtr, pvtu, ...)`,
+        set `(i, n)` to read only piece `i` out of `n` (e.g. the share of one MPI process).
 
     :Examples:
         .. code-block:: python
@@ -91,7 +166,6 @@ def load(inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True):
     if utils.isSequence(inputobj):
         flist = inputobj
     else:
-        import glob
         flist = sorted(glob.glob(inputobj))
 
     for fod in flist:
@@ -101,12 +175,17 @@ def load(inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True):
             if fod.endswith('.gz'):
                 fod = gunzip(fod)
 
-            a = _load_file(fod, c, alpha, threshold, spacing, unpack)
+            a = _load_file(fod, c, alpha, threshold, spacing, unpack, piece)
             acts.append(a)
 
         elif os.path.isdir(fod):### it's a directory or DICOM
-            flist = os.listdir(fod)
-            if '.dcm' in flist[0]: ### it's DICOM
+            if hasattr(os, 'scandir'): # DirEntry caches the file type, no stat() per file
+                flist = [e.name for e in os.scandir(fod) if e.is_file()]
+            else:
+                flist = [f for f in os.listdir(fod) if os.path.isfile(os.path.join(fod, f))]
+            if not flist:
+                colors.printc("~times Error in load(): no files found in directory", fod, c=1)
+            elif '.dcm' in flist[0]: ### it's DICOM
                 reader = vtk.vtkDICOMImageReader()
                 reader.SetDirectoryName(fod)
                 reader.Update()
@@ -126,9 +205,15 @@ def load(inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True):
                 acts.append(actor)
             else: ### it's a normal directory
                 utils.humansort(flist)
-                for ifile in flist:
-                    a = _load_file(fod+'/'+ifile, c, alpha, threshold, spacing, unpack)
-                    acts.append(a)
+                fnames = [os.path.join(fod, ifile) for ifile in flist]
+                loadf = lambda f: _load_file(f, c, alpha, threshold, spacing, unpack, piece)
+                if ThreadPoolExecutor and settings.loadThreads > 1 and len(fnames) > 1:
+                    # vtk readers spend most of the time in C++, read files concurrently
+                    nthreads = min(settings.loadThreads, len(fnames), os.cpu_count() or 1)
+                    with ThreadPoolExecutor(max_workers=nthreads) as ex:
+                        acts += list(ex.map(loadf, fnames))
+                else:
+                    acts += [loadf(f) for f in fnames]
         else:
             colors.printc("~times Error in load(): cannot find", fod, c=1)
 
@@ -145,8 +230,9 @@ def load(inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True):
         return acts
 
 
-def _load_file(filename, c, alpha, threshold, spacing, unpack):
+def _load_file(filename, c, alpha, threshold, spacing, unpack, piece=()):
     fl = filename.lower()
+    ext = os.path.splitext(fl)[1]
 
     ################################################################# other formats:
     if fl.endswith(".xml") or fl.endswith(".xml.gz") or fl.endswith(".xdmf"):
@@ -177,9 +263,7 @@ def _load_file(filename, c, alpha, threshold, spacing, unpack):
         actor = Assembly(wacts)
 
         ################################################################# volumetric:
-    elif fl.endswith(".tif") or fl.endswith(".slc") or fl.endswith(".vti") \
-        or fl.endswith(".mhd") or fl.endswith(".nrrd") or fl.endswith(".nii") \
-        or fl.endswith(".dem"):
+    elif ext in _image_readers:
         img = loadImageData(filename, spacing)
         if threshold is False:
             if c is None and alpha == 1:
@@ -191,13 +275,8 @@ def _load_file(filename, c, alpha, threshold, spacing, unpack):
             actor.color(c).alpha(alpha)
 
         ################################################################# 2D images:
-    elif fl.endswith(".png") or fl.endswith(".jpg") or fl.endswith(".bmp") or fl.endswith(".jpeg"):
-        if ".png" in fl:
-            picr = vtk.vtkPNGReader()
-        elif ".jpg" in fl or ".jpeg" in fl:
-            picr = vtk.vtkJPEGReader()
-        elif ".bmp" in fl:
-            picr = vtk.vtkBMPReader()
+    elif ext in _picture_readers:
+        picr = getattr(vtk, _picture_readers[ext])()
         picr.SetFileName(filename)
         picr.Update()
         actor = Picture()  # object derived from vtk.vtkImageActor()
@@ -245,11 +324,13 @@ def _load_file(filename, c, alpha, threshold, spacing, unpack):
 
         ################################################################# polygonal mesh:
     else:
-        if fl.endswith(".vtk"): # read all legacy vtk types
+        if ext not in _mesh_readers:
+            return None
 
+        reader = getattr(vtk, _mesh_readers[ext])()
+        if ext == ".vtk":
             #output can be:
             # PolyData, StructuredGrid, StructuredPoints, UnstructuredGrid, RectilinearGrid
-            reader = vtk.vtkDataSetReader()
             reader.ReadAllScalarsOn()
             reader.ReadAllVectorsOn()
             reader.ReadAllTensorsOn()
@@ -257,41 +338,11 @@ def _load_file(filename, c, alpha, threshold, spacing, unpack):
             reader.ReadAllNormalsOn()
             reader.ReadAllColorScalarsOn()
 
-        elif fl.endswith(".ply"):
-            reader = vtk.vtkPLYReader()
-        elif fl.endswith(".obj"):
-            reader = vtk.vtkOBJReader()
-        elif fl.endswith(".stl"):
-            reader = vtk.vtkSTLReader()
-        elif fl.endswith(".byu") or fl.endswith(".g"):
-            reader = vtk.vtkBYUReader()
-        elif fl.endswith(".foam"):  # OpenFoam
-            reader = vtk.vtkOpenFOAMReader()
-        elif fl.endswith(".pvd"):
-            reader = vtk.vtkXMLGenericDataObjectReader()
-        elif fl.endswith(".vtp"):
-            reader = vtk.vtkXMLPolyDataReader()
-        elif fl.endswith(".vts"):
-            reader = vtk.vtkXMLStructuredGridReader()
-        elif fl.endswith(".vtu"):
-            reader = vtk.vtkXMLUnstructuredGridReader()
-        elif fl.endswith(".vtr"):
-            reader = vtk.vtkXMLRectilinearGridReader()
-        elif fl.endswith(".pvtk"):
-            reader = vtk.vtkPDataSetReader()
-        elif fl.endswith(".pvtr"):
-            reader = vtk.vtkXMLPRectilinearGridReader()
-        elif fl.endswith("pvtu"):
-            reader = vtk.vtkXMLPUnstructuredGridReader()
-        elif fl.endswith(".txt") or fl.endswith(".xyz"):
-            reader = vtk.vtkParticleReader()  # (format is x, y, z, scalar)
-        elif fl.endswith(".facet"):
-            reader = vtk.vtkFacetReader()
-        else:
-            return None
-
         reader.SetFileName(filename)
-        reader.Update()
+        if len(piece) == 2 and isinstance(reader, vtk.vtkXMLReader):
+            reader.UpdatePiece(piece[0], piece[1], 0) # only this piece is read
+        else:
+            reader.Update()
         routput = reader.GetOutput()
 
         if not routput:
@@ -299,10 +350,11 @@ def _load_file(filename, c, alpha, threshold, spacing, unpack):
             return None
 
         actor = Mesh(routput, c, alpha)
-        if fl.endswith(".txt") or fl.endswith(".xyz"):
+        if ext in (".txt", ".xyz"):
             actor.GetProperty().SetPointSize(4)
 
-    actor.filename = filename
+    if actor is not None:
+        actor.filename = filename
     return actor
 
 def download(url, prefix=''):
@@ -317,13 +369,6 @@ def download(url, prefix=''):
         return basename
 
     colors.printc('..downloading:\n', url)
-    try:
-        from urllib.request import urlopen
-    except ImportError:
-        import urllib2
-        import contextlib
-        urlopen = lambda url_: contextlib.closing(urllib2.urlopen(url_))
-
     basename += prefix
     with urlopen(url) as response, open(basename, 'wb') as output:
         output.write(response.read())
@@ -334,10 +379,7 @@ def gunzip(filename):
     if not filename.endswith('.gz'):
         #colors.printc("gunzip() error: file must end with .gz", c=1)
         return filename
-    from tempfile import NamedTemporaryFile
-    import gzip
-
-    tmp_file = NamedTemporaryFile(delete=False)
+    tmp_file = tempfile.NamedTemporaryFile(delete=False)
     tmp_file.name = os.path.join(os.path.dirname(tmp_file.name),
                                  os.path.basename(filename).replace('.gz',''))
     inF = gzip.open(filename, "rb")
@@ -464,7 +506,6 @@ def loadGeoJSON(filename):
 def loadDolfin(filename, exterior=False):
     """Reads a `Fenics/Dolfin` file format (.xml or .xdmf).
     Return an ``Mesh(vtkActor)`` object."""
-    import sys
     if sys.version_info[0] < 3:
         return _loadDolfin_old(filename)
 
@@ -493,57 +534,73 @@ def loadDolfin(filename, exterior=False):
 
 
 def _loadDolfin_old(filename, exterior='dummy'):
-    import xml.etree.ElementTree as et
+    # only used with python 2, keep the optional lxml import out of the module scope
+    try:
+        from lxml import etree as xmlparser # libxml2 based, faster
+    except ImportError:
+        xmlparser = et
 
     if filename.endswith(".gz"):
-        import gzip
-
-        inF = gzip.open(filename, "rb")
-        outF = open("/tmp/filename.xml", "wb")
-        outF.write(inF.read())
-        outF.close()
-        inF.close()
-        tree = et.parse("/tmp/filename.xml")
+        source = gzip.open(filename, "rb") # decompressed while parsing
     else:
-        tree = et.parse(filename)
-
-    coords, connectivity = [], []
-    for mesh in tree.getroot():
-        for elem in mesh:
-            for e in elem.findall("vertex"):
-                x = float(e.get("x"))
-                y = float(e.get("y"))
-                ez = e.get("z")
-                if ez is None:
-                    coords.append([x, y])
-                else:
-                    z = float(ez)
-                    coords.append([x, y, z])
-
-            tets = elem.findall("tetrahedron")
-            if not len(tets):
-                tris = elem.findall("triangle")
-                for e in tris:
-                    v0 = int(e.get("v0"))
-                    v1 = int(e.get("v1"))
-                    v2 = int(e.get("v2"))
-                    connectivity.append([v0, v1, v2])
+        source = open(filename, "rb")
+
+    # stream the file and discard each element once it has been read,
+    # detaching the processed ones from their container every few hundred,
+    # so that the whole document tree is never held in memory.
+    # Arrays are preallocated from the size="" attribute of the containers.
+    coords = np.zeros((0, 3))
+    connectivity = np.zeros((0, 3), dtype=np.int64)
+    ncells, iv, ic = 0, 0, 0
+    container = None
+    try:
+        for event, elem in xmlparser.iterparse(source, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == "vertices":
+                    coords = np.zeros((int(elem.attrib["size"]), 3))
+                    container = elem
+                elif tag == "cells":
+                    ncells = int(elem.attrib["size"])
+                    container = elem
+                continue
+
+            if tag == "vertex":
+                at = elem.attrib
+                ez = at.get("z")
+                coords[iv, 0] = float(at["x"])
+                coords[iv, 1] = float(at["y"])
+                if ez is not None:
+                    coords[iv, 2] = float(ez)
+                iv += 1
+            elif tag == "tetrahedron":
+                if not ic:
+                    connectivity = np.empty((ncells, 4), dtype=np.int64)
+                at = elem.attrib
+                connectivity[ic] = (int(at["v0"]), int(at["v1"]), int(at["v2"]), int(at["v3"]))
+                ic += 1
+            elif tag == "triangle":
+                if not ic:
+                    connectivity = np.empty((ncells, 3), dtype=np.int64)
+                at = elem.attrib
+                connectivity[ic] = (int(at["v0"]), int(at["v1"]), int(at["v2"]))
+                ic += 1
+            elif tag in ("vertices", "cells"):
+                container = None
             else:
-                for e in tets:
-                    v0 = int(e.get("v0"))
-                    v1 = int(e.get("v1"))
-                    v2 = int(e.get("v2"))
-                    v3 = int(e.get("v3"))
-                    connectivity.append([v0, v1, v2, v3])
-
-    poly = utils.buildPolyData(coords, connectivity)
+                continue
+            elem.clear()
+            if container is not None and len(container) >= 512:
+                del container[:] # all children seen so far are complete
+    finally:
+        source.close()
+
+    poly = utils.buildPolyData(coords[:iv], connectivity[:ic])
     return Mesh(poly)
 
 
 def loadPVD(filename):
     """Reads a paraview set of files."""
-    import xml.etree.ElementTree as et
-
     tree = et.parse(filename)
 
     dname = os.path.dirname(filename)
@@ -589,22 +646,12 @@ def loadNeutral(filename):
     f.close()
 
     ncoords = int(lines[0])
-    coords = []
-    for i in range(1, ncoords + 1):
-        x, y, z = lines[i].split()
-        coords.append([float(x), float(y), float(z)])
+    coords = np.loadtxt(lines[1:ncoords+1], ndmin=2)
 
     ntets = int(lines[ncoords + 1])
-    idolf_tets = []
-    for i in range(ncoords + 2, ncoords + ntets + 2):
-        text = lines[i].split()
-        v0, v1, v2, v3 = int(text[1])-1, int(text[2])-1, int(text[3])-1, int(text[4])-1
-#        p0, p1, p2, p3 = np.array(coords[v1]), np.array(coords[v0]), coords[v3], coords[v2]
-#        d10 = p1-p0
-#        d21 = p2-p1
-#        dc = np.cross(d10, d21)
-#        print(np.dot(dc,p3-p0))
-        idolf_tets.append([v0, v1, v2, v3])
+    # first column is the subdomain, node numbering starts from 1
+    idolf_tets = np.loadtxt(lines[ncoords+2:ncoords+ntets+2],
+                            dtype=np.int64, usecols=(1,2,3,4), ndmin=2) - 1
 
     poly = utils.buildPolyData(coords, idolf_tets)
     return Mesh(poly)
@@ -612,58 +659,49 @@ def loadNeutral(filename):
 
 def loadGmesh(filename):
     """Reads a `gmesh` file format. Return an ``Mesh(vtkActor)`` object."""
-    f = open(filename, "r")
-    lines = f.readlines()
-    f.close()
+    node_coords = np.zeros((0, 3))
+    elements = np.zeros((0, 3), dtype=np.int64)
+
+    # single pass over a memory map of the file, sections are parsed as they come
+    with open(filename, "rb") as f:
+        if not os.fstat(f.fileno()).st_size: # an empty file cannot be mapped
+            colors.printc("~times Error in loadGmesh(): empty file", filename, c=1)
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        line = mm.readline()
+        while line:
+            if line.startswith(b"$Nodes"):
+                nnodes = int(mm.readline())
+                node_coords = np.loadtxt((mm.readline() for _ in range(nnodes)),
+                                         usecols=(1,2,3), ndmin=2)
+            elif line.startswith(b"$Elements"):
+                # element lines have a variable number of tags, vertex ids are the last three
+                nelements = int(mm.readline())
+                elements = np.array([mm.readline().split()[-3:] for _ in range(nelements)],
+                                    dtype=np.int64).reshape(-1, 3)
+                break
+            line = mm.readline()
+    finally:
+        mm.close()
 
-    nnodes = 0
-    index_nodes = 0
-    for i, line in enumerate(lines):
-        if "$Nodes" in line:
-            index_nodes = i + 1
-            nnodes = int(lines[index_nodes])
-            break
-    node_coords = []
-    for i in range(index_nodes + 1, index_nodes + 1 + nnodes):
-        cn = lines[i].split()
-        node_coords.append([float(cn[1]), float(cn[2]), float(cn[3])])
-
-    nelements = 0
-    index_elements = 0
-    for i, line in enumerate(lines):
-        if "$Elements" in line:
-            index_elements = i + 1
-            nelements = int(lines[index_elements])
-            break
-    elements = []
-    for i in range(index_elements + 1, index_elements + 1 + nelements):
-        ele = lines[i].split()
-        elements.append([int(ele[-3]), int(ele[-2]), int(ele[-1])])
-
-    poly = utils.buildPolyData(node_coords, elements, indexOffset=1)
+    poly = utils.buildPolyData(node_coords, elements-1) # numbering starts from 1
     return Mesh(poly)
 
 
 def loadPCD(filename):
     """Return a ``Mesh`` made of only vertex points
     from `Point Cloud` file format. Return an ``Mesh(vtkActor)`` object."""
-    f = open(filename, "r")
-    lines = f.readlines()
-    f.close()
-    start = False
-    pts = []
-    N, expN = 0, 0
-    for text in lines:
-        if start:
-            if N >= expN:
-                break
-            l = text.split()
-            pts.append([float(l[0]), float(l[1]), float(l[2])])
-            N += 1
-        if not start and "POINTS" in text:
-            expN = int(text.split()[1])
-        if not start and "DATA ascii" in text:
-            start = True
+    expN = 0
+    with open(filename, "r") as f:
+        text = f.readline()
+        while text and "DATA ascii" not in text: # header
+            if "POINTS" in text:
+                expN = int(text.split()[1])
+            text = f.readline()
+        pts = np.loadtxt(f, usecols=(0,1,2), max_rows=expN,
+                         dtype=np.float32, ndmin=2)
+    N = len(pts)
     if expN != N:
         colors.printc("~!? Mismatch in pcd file", expN, len(pts), c="red")
     poly = utils.buildPolyData(pts)
@@ -939,26 +977,17 @@ def loadImageData(filename, spacing=()):
     Use ``load`` instead.
     E.g. `img = load('myfile.tif').imagedata()`
     """
-    if ".tif" in filename.lower():
-        reader = vtk.vtkTIFFReader()
-    elif ".slc" in filename.lower():
-        reader = vtk.vtkSLCReader()
-        if not reader.CanReadFile(filename):
-            colors.printc("~prohibited Sorry bad slc file " + filename, c=1)
-            return None
-    elif ".vti" in filename.lower():
-        reader = vtk.vtkXMLImageDataReader()
-    elif ".mhd" in filename.lower():
-        reader = vtk.vtkMetaImageReader()
-    elif ".dem" in filename.lower():
-        reader = vtk.vtkDEMReader()
-    elif ".nii" in filename.lower():
-        reader = vtk.vtkNIFTIImageReader()
-    elif ".nrrd" in filename.lower():
-        reader = vtk.vtkNrrdReader()
-        if not reader.CanReadFile(filename):
-            colors.printc("~prohibited Sorry bad nrrd file " + filename, c=1)
-            return None
+    fl = filename.lower()
+    if fl.endswith(".gz"): # e.g. nifti readers can read .nii.gz directly
+        fl = fl[:-3]
+    ext = os.path.splitext(fl)[1]
+    if ext not in _image_readers:
+        colors.printc("~prohibited Unknown image format " + filename, c=1)
+        return None
+    reader = getattr(vtk, _image_readers[ext])()
+    if ext in (".slc", ".nrrd") and not reader.CanReadFile(filename):
+        colors.printc("~prohibited Sorry bad " + ext[1:] + " file " + filename, c=1)
+        return None
     reader.SetFileName(filename)
     reader.Update()
     image = reader.GetOutput()
@@ -985,23 +1014,21 @@ def write(objct, fileoutput, binary=True):
         obj = objct
 
     fr = fileoutput.lower()
-    if   fr.endswith(".vtk"):
-        writer = vtk.vtkPolyDataWriter()
-    elif fr.endswith(".ply"):
-        writer = vtk.vtkPLYWriter()
-        pscal = obj.GetPointData().GetScalars()
-        if not pscal:
-            pscal = obj.GetCellData().GetScalars()
-        if pscal and pscal.GetName():
-            writer.SetArrayName(pscal.GetName())
-            #writer.SetColorMode(0)
-        lut = objct.GetMapper().GetLookupTable()
-        if lut:
-            writer.SetLookupTable(lut)
-    elif fr.endswith(".stl"):
-        writer = vtk.vtkSTLWriter()
-    elif fr.endswith(".vtp"):
-        writer = vtk.vtkXMLPolyDataWriter()
+    ext = os.path.splitext(fr)[1]
+    if ext in _writers:
+        writer = getattr(vtk, _writers[ext])()
+        if ext == ".ply":
+            pscal = obj.GetPointData().GetScalars()
+            if not pscal:
+                pscal = obj.GetCellData().GetScalars()
+            if pscal and pscal.GetName():
+                writer.SetArrayName(pscal.GetName())
+                #writer.SetColorMode(0)
+            lut = objct.GetMapper().GetLookupTable()
+            if lut:
+                writer.SetLookupTable(lut)
+        elif ext == ".tif":
+            writer.SetFileDimensionality(len(obj.GetDimensions()))
     elif fr.endswith(".vtm"):
         g = vtk.vtkMultiBlockDataGroupFilter()
         for ob in objct:
@@ -1017,25 +1044,6 @@ def write(objct, fileoutput, binary=True):
         wri.SetFileName(fileoutput)
         wri.Write()
         return mb
-    elif fr.endswith(".xyz"):
-        writer = vtk.vtkSimplePointsWriter()
-    elif fr.endswith(".facet"):
-        writer = vtk.vtkFacetWriter()
-    elif fr.endswith(".tif"):
-        writer = vtk.vtkTIFFWriter()
-        writer.SetFileDimensionality(len(obj.GetDimensions()))
-    elif fr.endswith(".vti"):
-        writer = vtk.vtkXMLImageDataWriter()
-    elif fr.endswith(".mhd"):
-        writer = vtk.vtkMetaImageWriter()
-    elif fr.endswith(".nii"):
-        writer = vtk.vtkNIFTIImageWriter()
-    elif fr.endswith(".png"):
-        writer = vtk.vtkPNGWriter()
-    elif fr.endswith(".jpg"):
-        writer = vtk.vtkJPEGWriter()
-    elif fr.endswith(".bmp"):
-        writer = vtk.vtkBMPWriter()
     elif fr.endswith(".npy"):
         if utils.isSequence(objct):
             objslist = objct
@@ -1205,8 +1213,7 @@ def exportWindow(fileoutput, binary=False, speed=None, html=True):
         exporter.Write()
         if not html:
             return
-        from vtkplotter.docs import x3d_html
-        x3d_html = x3d_html.replace("~fileoutput", fileoutput)
+        x3d_html = docs.x3d_html.replace("~fileoutput", fileoutput)
         wsize = settings.plotter_instance.window.GetSize()
         x3d_html = x3d_html.replace("~width", str(wsize[0]))
         x3d_html = x3d_html.replace("~height", str(wsize[1]))
@@ -1409,51 +1416,110 @@ class Video:
     :param float duration: set the total `duration` of the video and recalculates `fps` accordingly.
     :param str ffmpeg: set path to ffmpeg program. Default value considers ffmpeg is in the path.
 
+    If `duration` is not set, frames are piped to ``ffmpeg`` as raw images while they are
+    generated, otherwise they are saved to a temporary directory until the video is closed.
+
     |makeVideo| |makeVideo.py|_
     """
 
     def __init__(self, name="movie.avi", **kwargs):
 
-        from tempfile import TemporaryDirectory
-
         self.name = name
         self.duration = kwargs.pop('duration', None)
         self.fps = float(kwargs.pop('fps', 12))
         self.ffmpeg = kwargs.pop('ffmpeg', 'ffmpeg')
+        if shutil.which(self.ffmpeg):
+            self.ffmpeg = shutil.which(self.ffmpeg)
+        else:
+            colors.printc("~times Video: cannot find program", self.ffmpeg, c=1)
         self.frames = []
-        self.tmp_dir = TemporaryDirectory()
+        self.tmp_dir = tempfile.TemporaryDirectory()
         self.get_filename = lambda x: os.path.join(self.tmp_dir.name, x)
+        self._stream = not self.duration # fps must be known before the first frame
+        self._proc = None      # ffmpeg process reading frames from stdin
+        self._lastframe = None # raw bytes of the last streamed frame
+        self._broken = False   # ffmpeg exited before reading all frames
         colors.printc("~video Video", name, "is open...", c="m")
 
     def addFrame(self):
         """Add frame to current video."""
+        if self._stream:
+            img = screenshot(returnNumpy=True)
+            if img is None:
+                return
+            if self._proc is None:
+                h, w = img.shape[:2]
+                self.fps = int(self.fps)
+                self.name = os.path.splitext(self.name)[0]+'.mp4'
+                try:
+                    self._proc = subprocess.Popen([self.ffmpeg, "-loglevel", "error", "-y",
+                                                   "-f", "rawvideo", "-pix_fmt", "rgb24",
+                                                   "-s", "%dx%d" % (w, h), "-r", str(self.fps),
+                                                   "-i", "-", self.name],
+                                                  stdin=subprocess.PIPE)
+                except OSError:
+                    colors.printc("~times Cannot run", self.ffmpeg,
+                                  "saving frames to disk instead", c=1)
+                    self._stream = False
+                    return self.addFrame()
+            self._lastframe = np.ascontiguousarray(img).tobytes()
+            self._write(self._lastframe)
+            return
+
         fr = self.get_filename(str(len(self.frames)) + ".png")
         screenshot(fr)
         self.frames.append(fr)
 
     def pause(self, pause=0):
         """Insert a `pause`, in seconds."""
-        fr = self.frames[-1]
         n = int(self.fps * pause)
+        if self._proc:
+            for _ in range(n):
+                self._write(self._lastframe)
+            return
+
+        fr = self.frames[-1]
         for _ in range(n):
             fr2 = self.get_filename(str(len(self.frames)) + ".png")
             self.frames.append(fr2)
-            os.system("cp -f %s %s" % (fr, fr2))
+            try: # a hard link costs no copy
+                os.link(fr, fr2)
+            except (OSError, AttributeError):
+                shutil.copyfile(fr, fr2)
+
+    def _write(self, frame):
+        if self._broken:
+            return
+        try:
+            self._proc.stdin.write(frame)
+        except (IOError, OSError): # ffmpeg has exited, the error is reported by close()
+            self._broken = True
 
     def close(self):
         """Render the video and write to file."""
-        if self.duration:
-            self.fps = len(self.frames) / float(self.duration)
-            colors.printc("Recalculated video FPS to", round(self.fps, 3), c="m")
+        if self._proc:
+            try:
+                self._proc.stdin.close()
+            except (IOError, OSError):
+                self._broken = True
+            out = self._proc.wait() or self._broken
         else:
-            self.fps = int(self.fps)
-        self.name = self.name.split('.')[0]+'.mp4'
-        out = os.system(self.ffmpeg + " -loglevel panic -y -r " + str(self.fps)
-                        + " -i " + self.tmp_dir.name + os.sep + "%01d.png " + self.name)
+            if self.duration:
+                self.fps = len(self.frames) / float(self.duration)
+                colors.printc("Recalculated video FPS to", round(self.fps, 3), c="m")
+            else:
+                self.fps = int(self.fps)
+            self.name = os.path.splitext(self.name)[0]+'.mp4'
+            try:
+                out = subprocess.call([self.ffmpeg, "-loglevel", "panic", "-y",
+                                       "-r", str(self.fps),
+                                       "-i", os.path.join(self.tmp_dir.name, "%01d.png"),
+                                       self.name])
+            except OSError:
+                out = 1
         if out:
             colors.printc("ffmpeg returning error", c=1)
         colors.printc("~save Video saved as", self.name, c="m")
         self.tmp_dir.cleanup()
         return
 
-